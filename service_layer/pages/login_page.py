@@ -1,6 +1,6 @@
 """Login page - pure UI components, no business logic."""
 import streamlit as st
-from ..services import AuthenticationService, CaptchaService
+from ..services import AuthenticationService, CaptchaService, PasswordService
 from ..models import AuthenticationResult
 
 
@@ -84,7 +84,6 @@ class LoginPage:
         
         # Show password validation
         if new_pass:
-            from ..services import PasswordService
             if not PasswordService.is_valid_password(new_pass):
                 st.warning("Password must be at least 8 characters long and include uppercase, lowercase, number, and special character.")
         
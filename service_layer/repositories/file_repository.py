@@ -1,9 +1,10 @@
 """File-based data repository implementations."""
-import json
 import os
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
+import orjson
+
 
 class Repository(ABC):
     """Abstract base repository interface."""
@@ -42,14 +43,17 @@ class FileRepository:
     def load_data(self) -> Dict[str, Any]:
         """Load JSON data from file."""
         if os.path.exists(self.filepath):
-            with open(self.filepath, "r") as f:
-                return json.load(f)
+            with open(self.filepath, "rb") as f:
+                return orjson.loads(f.read())
         return {}
     
     def save_data(self, data: Dict[str, Any]) -> None:
         """Save JSON data to file."""
-        with open(self.filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        # Same 2-space layout as json.dump(indent=2); non-str keys are
+        # stringified as the stdlib encoder does
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(self.filepath, "wb") as f:
+            f.write(content)
 
 
 class UserRepository(FileRepository):
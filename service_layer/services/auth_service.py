@@ -40,11 +40,11 @@ class AuthenticationService:
     """Pure business logic for authentication - no Streamlit dependencies."""
     
     def __init__(self, user_repo: UserRepository, attempts_repo: FailedAttemptsRepository, 
-                 audit_repo: AuditRepository):
+                 audit_repo: AuditRepository, password_service: Optional[PasswordService] = None):
         self.user_repo = user_repo
         self.attempts_repo = attempts_repo
         self.audit_repo = audit_repo
-        self.password_service = PasswordService()
+        self.password_service = password_service if password_service is not None else PasswordService()
     
     def authenticate(self, username: str, password: str) -> AuthenticationResult:
         """Authenticate user credentials."""
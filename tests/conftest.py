@@ -7,37 +7,58 @@ to all tests without explicit imports.
 """
 
 import pytest
-import tempfile
 import os
-from unittest.mock import Mock
+from unittest.mock import create_autospec
 from service_layer.repositories import UserRepository, FailedAttemptsRepository, AuditRepository
-from service_layer.services import AuthenticationService, TimelineDataService, CaptchaService
+from service_layer.services import AuthenticationService, PasswordService, TimelineDataService, TimelineVisualizationService, CaptchaService
 from service_layer.models import User
 
 
 @pytest.fixture
-def temp_directory():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield tmp_dir
+def temp_directory(tmp_path_factory):
+    """Create a temporary directory for test files.
+
+    Directories live under pytest's base temp and are pruned by its retention
+    policy (last 3 runs), so no rmtree runs during teardown.
+    """
+    return str(tmp_path_factory.mktemp("repo", numbered=True))
+
+
+@pytest.fixture(scope="module")
+def shared_repository_mocks():
+    """Repository mocks built once per module; use the fixtures below to get them reset.
+
+    Autospec with spec_set fixes each mock's attributes and method signatures
+    to the real repository, so misspelled methods or bad call arguments fail.
+    """
+    return tuple(
+        create_autospec(repo_class, spec_set=True, instance=True)
+        for repo_class in (UserRepository, FailedAttemptsRepository, AuditRepository)
+    )
+
+
+def _reset(mock):
+    """Clear recorded calls and configured return values/side effects."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
 
 
 @pytest.fixture
-def mock_user_repository():
+def mock_user_repository(shared_repository_mocks):
     """Mock user repository for isolated testing."""
-    return Mock(spec=UserRepository)
+    return _reset(shared_repository_mocks[0])
 
 
 @pytest.fixture
-def mock_failed_attempts_repository():
+def mock_failed_attempts_repository(shared_repository_mocks):
     """Mock failed attempts repository for isolated testing."""
-    return Mock(spec=FailedAttemptsRepository)
+    return _reset(shared_repository_mocks[1])
 
 
 @pytest.fixture
-def mock_audit_repository():
+def mock_audit_repository(shared_repository_mocks):
     """Mock audit repository for isolated testing."""
-    return Mock(spec=AuditRepository)
+    return _reset(shared_repository_mocks[2])
 
 
 @pytest.fixture
@@ -56,10 +77,16 @@ def real_repositories(temp_directory):
 
 
 @pytest.fixture
-def auth_service_with_mocks(mock_repositories):
+def mock_password_service():
+    """Mock password service for injecting into AuthenticationService."""
+    return create_autospec(PasswordService, spec_set=True, instance=True)
+
+
+@pytest.fixture
+def auth_service_with_mocks(mock_repositories, mock_password_service):
     """AuthenticationService with mocked dependencies."""
     user_repo, attempts_repo, audit_repo = mock_repositories
-    return AuthenticationService(user_repo, attempts_repo, audit_repo)
+    return AuthenticationService(user_repo, attempts_repo, audit_repo, mock_password_service)
 
 
 @pytest.fixture
@@ -90,15 +117,51 @@ def sample_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def known_bcrypt_hash():
+    """bcrypt hash of "TestPassword123!", computed once per session."""
+    return PasswordService.hash_password("TestPassword123!")
+
+
+@pytest.fixture(scope="session")
 def timeline_service():
-    """TimelineDataService for testing."""
+    """TimelineDataService for testing; stateless, so one instance serves the session."""
     return TimelineDataService()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_timeline(timeline_service):
+    """Sample TimelineData, generated once per session. Treat as read-only."""
+    return timeline_service.get_sample_timeline_data()
+
+
+@pytest.fixture(scope="session")
+def sample_df(sample_timeline):
+    """sample_timeline.to_dataframe(), built once per session. Treat as read-only."""
+    return sample_timeline.to_dataframe()
+
+
+@pytest.fixture(scope="session")
+def viz_service():
+    """TimelineVisualizationService for testing; stateless, so one instance serves the session."""
+    return TimelineVisualizationService()
+
+
+@pytest.fixture(scope="session")
+def sample_chart(viz_service, sample_timeline):
+    """Plotly figure for sample_timeline, built once per session. Treat as read-only."""
+    return viz_service.create_timeline_chart(sample_timeline)
+
+
+@pytest.fixture(scope="session")
+def chart_spec(sample_chart):
+    """sample_chart as a plain dict (to_plotly_json), so asserts skip Plotly's validators."""
+    return sample_chart.to_plotly_json()
+
+
+@pytest.fixture(scope="session")
 def captcha_service():
-    """CaptchaService for testing."""
+    """CaptchaService for testing; stateless, so one instance serves the session."""
     return CaptchaService()
 
 
@@ -0,0 +1,28 @@
+"""
+UI test fixtures.
+
+Fixtures defined here apply only to tests under tests/ui/.
+"""
+
+import pytest
+from unittest.mock import Mock
+from service_layer.pages import TimelinePage
+from service_layer.services import TimelineDataService, TimelineVisualizationService
+
+
+@pytest.fixture(scope="module")
+def timeline_services():
+    """Timeline data and visualization service mocks shared across a module."""
+    return Mock(spec=TimelineDataService), Mock(spec=TimelineVisualizationService)
+
+
+@pytest.fixture
+def timeline_page(timeline_services):
+    """TimelinePage wired to the shared service mocks, reset for each test.
+
+    Yields ``(page, data_service, viz_service)``.
+    """
+    data_service, viz_service = timeline_services
+    data_service.reset_mock(return_value=True, side_effect=True)
+    viz_service.reset_mock(return_value=True, side_effect=True)
+    yield TimelinePage(data_service, viz_service), data_service, viz_service
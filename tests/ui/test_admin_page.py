@@ -20,6 +20,8 @@ import streamlit as st
 from service_layer.pages import AdminPage
 from service_layer.models import User
 
+pytestmark = [pytest.mark.ui, pytest.mark.fast]
+
 
 class TestAdminPageAccessControl:
     """Test suite for admin page access control."""
@@ -14,390 +14,384 @@ Test Categories:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import streamlit as st
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock, call
+import streamlit as _st
 from service_layer.pages import LoginPage
+from service_layer.pages import login_page as _login_page_mod
+from service_layer.services import AuthenticationService, CaptchaService, PasswordService
 from service_layer.models import AuthenticationResult, User
 
 
-class TestLoginPageRendering:
-    """Test suite for login page UI rendering."""
-    
-    @patch('streamlit.title')
-    @patch('streamlit.tabs')
-    def test_login_page_renders_basic_structure(self, mock_tabs, mock_title):
-        """
-        Test: Login page renders basic UI structure
-        
-        Given: LoginPage with mocked services
-        When: render() is called
-        Then: Page title and tabs are displayed
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock tabs to return mock tab contexts
-        mock_login_tab = MagicMock()
-        mock_reset_tab = MagicMock()
-        mock_tabs.return_value = (mock_login_tab, mock_reset_tab)
-        
-        # Act
+pytestmark = [pytest.mark.ui, pytest.mark.fast]
+
+
+# Authentication outcomes are never mutated by LoginPage, so build them once.
+_TEST_USER = User("test_user", "test@example.com", "admin", "hash")
+_SUCCESS_RESULT = AuthenticationResult(success=True, user=_TEST_USER)
+_FAIL_RESULT = AuthenticationResult(success=False, error_message="Invalid username or password")
+
+# Successive st.text_input values, in the order the page asks for them.
+_CAPTCHA_INPUTS = ("locked_user", "password", "10")
+_WEAK_RESET_INPUTS = ("test_user", "weak")
+_RESET_INPUTS = ("test_user", "StrongPass123!")
+
+
+@pytest.fixture(scope="module")
+def services():
+    """Auth and CAPTCHA service mocks shared across the module.
+
+    spec_set restricts each mock to the real service API, so attribute
+    lookups never mint ad-hoc child mocks and typos fail loudly.
+    """
+    return Mock(spec_set=AuthenticationService), Mock(spec_set=CaptchaService)
+
+
+@pytest.fixture
+def login_page(services):
+    """LoginPage wired to the shared service mocks, reset for each test."""
+    auth_service, captcha_service = services
+    auth_service.reset_mock(return_value=True, side_effect=True)
+    captcha_service.reset_mock(return_value=True, side_effect=True)
+    return LoginPage(auth_service, captcha_service)
+
+
+def _stub(**kwargs) -> SimpleNamespace:
+    """Service stand-in whose methods return fixed values and record nothing.
+
+    Use for services a test only reads results from; keep Mock for services
+    whose calls are asserted on.
+    """
+    return SimpleNamespace(**{
+        name: value if callable(value) else (lambda *_args, _value=value, **_kwargs: _value)
+        for name, value in kwargs.items()
+    })
+
+
+def _called_once(mock, *args, **kwargs) -> None:
+    """Assert ``mock`` was called exactly once, with the given arguments."""
+    assert mock.call_count == 1, f"expected 1 call, got {mock.call_count}"
+    assert mock.call_args == call(*args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def password_service_mock():
+    """Swap the login page's PasswordService for a mock by direct assignment."""
+    original = _login_page_mod.PasswordService
+    _login_page_mod.PasswordService = Mock(spec_set=PasswordService)
+    yield _login_page_mod.PasswordService
+    _login_page_mod.PasswordService = original
+
+
+class _SessionState(dict):
+    """Dict-backed stand-in for st.session_state with key and attribute access."""
+    
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+    
+    def __setattr__(self, key, value):
+        self[key] = value
+    
+    def __delattr__(self, key):
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+def _install_session_state(initial):
+    """Install a fresh _SessionState seeded with ``initial`` and return it."""
+    _st.session_state = _SessionState(initial)
+    return _st.session_state
+
+
+@pytest.fixture(autouse=True)
+def _restore_session_state():
+    """Put back the real session state after tests that install a stand-in."""
+    original = _st.session_state
+    yield
+    _st.session_state = original
+
+
+# Login and reset tab contexts handed out by the st.tabs stub.
+_TAB_PAIR = (MagicMock(), MagicMock())
+
+_STREAMLIT_STUBS = ("title", "tabs", "text_input", "button", "warning", "success", "error", "rerun")
+
+
+@pytest.fixture(autouse=True)
+def streamlit_stubs():
+    """Replace the Streamlit calls LoginPage makes with mocks by direct assignment."""
+    originals = {name: getattr(_st, name) for name in _STREAMLIT_STUBS}
+    for name in _STREAMLIT_STUBS:
+        setattr(_st, name, Mock())
+    for tab in _TAB_PAIR:
+        tab.reset_mock()
+    _st.tabs.return_value = _TAB_PAIR
+    _st.text_input.return_value = ""
+    _st.button.return_value = False
+    yield _st
+    for name, original in originals.items():
+        setattr(_st, name, original)
+
+
+# Login page UI rendering
+
+def test_login_page_renders_basic_structure(login_page):
+    """
+    Test: Login page renders basic UI structure
+    
+    Given: LoginPage with mocked services
+    When: render() is called
+    Then: Page title and tabs are displayed
+    """
+    # Act
+    login_page.render()
+    
+    # Assert
+    _called_once(_st.title, "🔐 Clinical Timeline App Login")
+    _called_once(_st.tabs, ["Login", "Forgot Password"])
+
+
+def test_login_tab_renders_input_fields(login_page):
+    """
+    Test: Login tab content is rendered by render()
+    
+    Given: LoginPage with mocked tabs
+    When: render() is called
+    Then: The login tab renderer is invoked once
+    """
+    # Act
+    with patch.object(login_page, '_render_login_tab') as mock_render_login:
         login_page.render()
-        
-        # Assert
-        mock_title.assert_called_once_with("🔐 Clinical Timeline App Login")
-        mock_tabs.assert_called_once_with(["Login", "Forgot Password"])
-    
-    @patch('streamlit.text_input')
-    @patch('streamlit.button')
-    @patch('streamlit.tabs')
-    def test_login_tab_renders_input_fields(self, mock_tabs, mock_button, mock_text_input):
-        """
-        Test: Login tab renders username and password input fields
-        
-        Given: LoginPage in login tab
-        When: Login tab is rendered
-        Then: Username and password inputs are displayed
-        And: Login button is displayed
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock streamlit components
-        mock_login_tab = MagicMock()
-        mock_reset_tab = MagicMock()
-        mock_tabs.return_value = (mock_login_tab, mock_reset_tab)
-        mock_text_input.side_effect = ["test_user", "test_password"]
-        mock_button.return_value = False  # Button not clicked
-        
-        # Act
-        with patch.object(login_page, '_render_login_tab') as mock_render_login:
-            login_page.render()
-            # Simulate entering the login tab context
-            mock_render_login.assert_called_once()
-
-
-class TestLoginPageInteractions:
-    """Test suite for login page user interactions."""
-    
-    def test_successful_login_updates_session_state(self):
-        """
-        Test: Successful login updates session state correctly
-        
-        Given: Valid credentials and successful authentication
-        When: Login is attempted
-        Then: Session state is updated with user data
-        And: Success message is displayed
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock successful authentication
-        test_user = User("test_user", "test@example.com", "admin", "hash")
-        auth_service.authenticate.return_value = AuthenticationResult(
-            success=True,
-            user=test_user
-        )
-        auth_service.needs_captcha.return_value = False
-        
-        # Act
-        with patch('streamlit.success') as mock_success, \
-             patch('streamlit.rerun') as mock_rerun, \
-             patch('streamlit.session_state', {}) as mock_session:
-            
-            login_page._handle_login("test_user", "test_password")
-        
-        # Assert
+    
+    # Assert
+    mock_render_login.assert_called_once()
+
+
+# Login page user interactions
+
+@pytest.mark.parametrize("auth_result,error_msg", [
+    (_SUCCESS_RESULT, None),
+    (_FAIL_RESULT, "Invalid username or password"),
+], ids=["success", "failure"])
+def test_login_updates_session_state_or_shows_error(auth_result, error_msg):
+    """
+    Test: Login outcome is reflected in session state and messages
+    
+    Given: Credentials that authenticate successfully or fail
+    When: Login is attempted
+    Then: On success, session state holds the user and success is shown
+    And: On failure, the error is shown and session state is untouched
+    """
+    # Arrange
+    login_page = LoginPage(_stub(authenticate=auth_result, needs_captcha=False), _stub())
+    
+    # Act
+    mock_session = _install_session_state({})
+    login_page._handle_login("test_user", "test_password")
+    
+    # Assert
+    if error_msg is None:
         assert mock_session['authenticated'] == True
-        assert mock_session['current_user'] == test_user
-        mock_success.assert_called_once_with("Access granted! Redirecting...")
-        mock_rerun.assert_called_once()
-    
-    def test_failed_login_shows_error_message(self):
-        """
-        Test: Failed login displays appropriate error message
-        
-        Given: Invalid credentials
-        When: Login is attempted
-        Then: Error message is displayed
-        And: Session state is not updated
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock failed authentication
-        auth_service.authenticate.return_value = AuthenticationResult(
-            success=False,
-            error_message="Invalid username or password"
-        )
-        auth_service.needs_captcha.return_value = False
-        
-        # Act
-        with patch('streamlit.error') as mock_error, \
-             patch('streamlit.session_state', {}) as mock_session:
-            
-            login_page._handle_login("test_user", "wrong_password")
-        
-        # Assert
-        mock_error.assert_called_once_with("Invalid username or password")
+        assert mock_session['current_user'] == _TEST_USER
+        _called_once(_st.success, "Access granted! Redirecting...")
+        _st.rerun.assert_called_once()
+    else:
+        _called_once(_st.error, error_msg)
         assert 'authenticated' not in mock_session
         assert 'current_user' not in mock_session
+
+
+def test_captcha_required_displays_challenge(login_page, services):
+    """
+    Test: CAPTCHA challenge is displayed when required
     
-    def test_captcha_required_displays_challenge(self):
-        """
-        Test: CAPTCHA challenge is displayed when required
-        
-        Given: User account that requires CAPTCHA
-        When: Login page is rendered
-        Then: CAPTCHA challenge is displayed
-        And: CAPTCHA input field is shown
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        auth_service.needs_captcha.return_value = True
-        captcha_service.generate_challenge.return_value = (3, 7)
-        captcha_service.get_challenge_text.return_value = "What is 3 + 7?"
-        
-        # Act
-        with patch('streamlit.text_input', side_effect=["locked_user", "password", "10"]) as mock_input, \
-             patch('streamlit.session_state', {}) as mock_session:
-            
-            result = login_page._render_captcha()
-        
-        # Assert
-        # Verify CAPTCHA was initialized in session state
-        assert 'captcha_x' in mock_session
-        assert 'captcha_y' in mock_session
-        captcha_service.get_challenge_text.assert_called()
-    
-    def test_incorrect_captcha_shows_error_and_regenerates(self):
-        """
-        Test: Incorrect CAPTCHA shows error and generates new challenge
-        
-        Given: User with CAPTCHA requirement and wrong answer
-        When: Login is attempted with incorrect CAPTCHA
-        Then: Error message is displayed
-        And: New CAPTCHA challenge is generated
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        auth_service.needs_captcha.return_value = True
-        captcha_service.validate_answer.return_value = False
-        captcha_service.generate_challenge.return_value = (5, 8)
-        
-        # Act
-        with patch('streamlit.error') as mock_error, \
-             patch('streamlit.session_state', {'captcha_x': 3, 'captcha_y': 7}) as mock_session:
-            
-            login_page._handle_login("locked_user", "password", "9")  # Wrong CAPTCHA answer
-        
-        # Assert
-        mock_error.assert_called_once_with("CAPTCHA incorrect. Please try again.")
-        captcha_service.generate_challenge.assert_called_once()
-        # Verify new CAPTCHA values are set
-        assert mock_session['captcha_x'] == 5
-        assert mock_session['captcha_y'] == 8
-
-
-class TestPasswordResetFunctionality:
-    """Test suite for password reset UI functionality."""
-    
-    @patch('streamlit.text_input')
-    @patch('streamlit.button')
-    @patch('streamlit.warning')
-    def test_weak_password_shows_warning(self, mock_warning, mock_button, mock_text_input):
-        """
-        Test: Weak password input shows validation warning
-        
-        Given: Password reset form with weak password
-        When: Password is entered
-        Then: Warning message is displayed about password requirements
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock weak password input
-        mock_text_input.side_effect = ["test_user", "weak"]
-        mock_button.return_value = False
-        
-        # Mock password validation
-        with patch('service_layer.services.PasswordService') as mock_password_service:
-            mock_password_service.is_valid_password.return_value = False
-            
-            # Act
-            login_page._render_reset_tab()
-        
-        # Assert
-        mock_warning.assert_called_once_with(
-            "Password must be at least 8 characters long and include uppercase, lowercase, number, and special character."
-        )
-    
-    def test_successful_password_reset_shows_success(self):
-        """
-        Test: Successful password reset shows success message
-        
-        Given: Valid username and strong password
-        When: Password reset is submitted
-        Then: Success message is displayed
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock successful password reset
-        auth_service.reset_password.return_value = True
-        
-        # Act
-        with patch('streamlit.text_input', side_effect=["test_user", "StrongPass123!"]), \
-             patch('streamlit.button', return_value=True), \
-             patch('streamlit.success') as mock_success, \
-             patch('service_layer.pages.login_page.PasswordService') as mock_password_service:
-            
-            mock_password_service.is_valid_password.return_value = True
-            login_page._render_reset_tab()
-        
-        # Assert
-        auth_service.reset_password.assert_called_once_with("test_user", "StrongPass123!")
-        mock_success.assert_called_once_with("Password reset successful. Please log in with your new password.")
-    
-    def test_failed_password_reset_shows_error(self):
-        """
-        Test: Failed password reset shows error message
-        
-        Given: Invalid username or password reset failure
-        When: Password reset is attempted
-        Then: Error message is displayed
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        # Mock failed password reset
-        auth_service.reset_password.return_value = False
-        
-        # Act
-        with patch('streamlit.text_input', side_effect=["invalid_user", "StrongPass123!"]), \
-             patch('streamlit.button', return_value=True), \
-             patch('streamlit.error') as mock_error, \
-             patch('service_layer.pages.login_page.PasswordService') as mock_password_service:
-            
-            mock_password_service.is_valid_password.return_value = True
-            login_page._render_reset_tab()
-        
-        # Assert
-        auth_service.reset_password.assert_called_once_with("invalid_user", "StrongPass123!")
-        mock_error.assert_called_once_with("Password reset failed. Please check your username and password requirements.")
-
-
-class TestSessionStateManagement:
-    """Test suite for session state management in login page."""
-    
-    def test_captcha_state_initialization(self):
-        """
-        Test: CAPTCHA state is properly initialized in session
-        
-        Given: Login page with CAPTCHA requirement
-        When: CAPTCHA is rendered for first time
-        Then: Session state contains CAPTCHA values
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        captcha_service.generate_challenge.return_value = (4, 9)
-        captcha_service.get_challenge_text.return_value = "What is 4 + 9?"
-        
-        # Act
-        with patch('streamlit.text_input', return_value="13"), \
-             patch('streamlit.session_state', {}) as mock_session:
-            
-            login_page._render_captcha()
-        
-        # Assert
-        assert mock_session['captcha_x'] == 4
-        assert mock_session['captcha_y'] == 9
-    
-    def test_captcha_state_persists_across_renders(self):
-        """
-        Test: CAPTCHA values persist across page renders
-        
-        Given: CAPTCHA already initialized in session state
-        When: CAPTCHA is rendered again
-        Then: Same CAPTCHA values are used
-        And: Challenge text reflects existing values
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        captcha_service.get_challenge_text.return_value = "What is 6 + 2?"
-        
-        # Act
-        with patch('streamlit.text_input', return_value="8"), \
-             patch('streamlit.session_state', {'captcha_x': 6, 'captcha_y': 2}) as mock_session:
-            
-            login_page._render_captcha()
-        
-        # Assert
-        # Verify existing values are preserved
-        assert mock_session['captcha_x'] == 6
-        assert mock_session['captcha_y'] == 2
-        # Verify generate_challenge was not called (values already exist)
-        captcha_service.generate_challenge.assert_not_called()
-        # Verify challenge text uses existing values
-        captcha_service.get_challenge_text.assert_called_with(6, 2)
-    
-    def test_authentication_clears_sensitive_state(self):
-        """
-        Test: Successful authentication clears sensitive session data
-        
-        Given: Session state with authentication-related data
-        When: Successful login occurs
-        Then: User data is set in session
-        And: Temporary authentication data is preserved for user experience
-        """
-        # Arrange
-        auth_service = Mock()
-        captcha_service = Mock()
-        login_page = LoginPage(auth_service, captcha_service)
-        
-        test_user = User("test_user", "test@example.com", "admin", "hash")
-        auth_service.authenticate.return_value = AuthenticationResult(
-            success=True,
-            user=test_user
-        )
-        auth_service.needs_captcha.return_value = False
-        
-        # Act
-        with patch('streamlit.success'), \
-             patch('streamlit.rerun'), \
-             patch('streamlit.session_state', {'temp_data': 'should_remain'}) as mock_session:
-            
-            login_page._handle_login("test_user", "password")
-        
-        # Assert
-        # Verify authentication data is set
-        assert mock_session['authenticated'] == True
-        assert mock_session['current_user'] == test_user
-        # Verify other session data is preserved
-        assert mock_session['temp_data'] == 'should_remain'
\ No newline at end of file
+    Given: User account that requires CAPTCHA
+    When: Login page is rendered
+    Then: CAPTCHA challenge is displayed
+    And: CAPTCHA input field is shown
+    """
+    # Arrange
+    auth_service, captcha_service = services
+    
+    auth_service.needs_captcha.return_value = True
+    captcha_service.generate_challenge.return_value = (3, 7)
+    captcha_service.get_challenge_text.return_value = "What is 3 + 7?"
+    
+    # Act
+    _st.text_input.side_effect = iter(_CAPTCHA_INPUTS)
+    mock_session = _install_session_state({})
+    login_page._render_captcha()
+    
+    # Assert
+    # Verify CAPTCHA was initialized in session state
+    assert 'captcha_x' in mock_session
+    assert 'captcha_y' in mock_session
+    captcha_service.get_challenge_text.assert_called()
+
+
+def test_incorrect_captcha_shows_error_and_regenerates(login_page, services):
+    """
+    Test: Incorrect CAPTCHA shows error and generates new challenge
+    
+    Given: User with CAPTCHA requirement and wrong answer
+    When: Login is attempted with incorrect CAPTCHA
+    Then: Error message is displayed
+    And: New CAPTCHA challenge is generated
+    """
+    # Arrange
+    auth_service, captcha_service = services
+    
+    auth_service.needs_captcha.return_value = True
+    captcha_service.validate_answer.return_value = False
+    captcha_service.generate_challenge.return_value = (5, 8)
+    
+    # Act
+    mock_session = _install_session_state({'captcha_x': 3, 'captcha_y': 7})
+    login_page._handle_login("locked_user", "password", "9")  # Wrong CAPTCHA answer
+    
+    # Assert
+    _called_once(_st.error, "CAPTCHA incorrect. Please try again.")
+    captcha_service.generate_challenge.assert_called_once()
+    # Verify new CAPTCHA values are set
+    assert mock_session['captcha_x'] == 5
+    assert mock_session['captcha_y'] == 8
+
+
+# Password reset UI functionality
+
+def test_weak_password_shows_warning(login_page, password_service_mock):
+    """
+    Test: Weak password input shows validation warning
+    
+    Given: Password reset form with weak password
+    When: Password is entered
+    Then: Warning message is displayed about password requirements
+    """
+    # Arrange
+    # Mock weak password input
+    _st.text_input.side_effect = iter(_WEAK_RESET_INPUTS)
+    _st.button.return_value = False
+    
+    # Mock password validation
+    password_service_mock.is_valid_password.return_value = False
+    
+    # Act
+    login_page._render_reset_tab()
+    
+    # Assert
+    _called_once(
+        _st.warning,
+        "Password must be at least 8 characters long and include uppercase, lowercase, number, and special character."
+    )
+
+
+@pytest.mark.parametrize("reset_ok,assert_fn,msg", [
+    (True, "success", "Password reset successful. Please log in with your new password."),
+    (False, "error", "Password reset failed. Please check your username and password requirements."),
+], ids=["success", "failure"])
+def test_password_reset_shows_outcome_message(login_page, services, password_service_mock,
+                                              reset_ok, assert_fn, msg):
+    """
+    Test: Password reset shows a success or error message
+    
+    Given: Username and strong password, with reset succeeding or failing
+    When: Password reset is submitted
+    Then: The matching success or error message is displayed
+    """
+    # Arrange
+    auth_service, _ = services
+    auth_service.reset_password.return_value = reset_ok
+    password_service_mock.is_valid_password.return_value = True
+    _st.text_input.side_effect = iter(_RESET_INPUTS)
+    _st.button.return_value = True
+    
+    # Act
+    login_page._render_reset_tab()
+    
+    # Assert
+    _called_once(auth_service.reset_password, *_RESET_INPUTS)
+    _called_once(getattr(_st, assert_fn), msg)
+
+
+# Session state management in login page
+
+def test_captcha_state_initialization(login_page, services):
+    """
+    Test: CAPTCHA state is properly initialized in session
+    
+    Given: Login page with CAPTCHA requirement
+    When: CAPTCHA is rendered for first time
+    Then: Session state contains CAPTCHA values
+    """
+    # Arrange
+    _, captcha_service = services
+    
+    captcha_service.generate_challenge.return_value = (4, 9)
+    captcha_service.get_challenge_text.return_value = "What is 4 + 9?"
+    
+    # Act
+    _st.text_input.return_value = "13"
+    mock_session = _install_session_state({})
+    login_page._render_captcha()
+    
+    # Assert
+    assert mock_session['captcha_x'] == 4
+    assert mock_session['captcha_y'] == 9
+
+
+def test_captcha_state_persists_across_renders(login_page, services):
+    """
+    Test: CAPTCHA values persist across page renders
+    
+    Given: CAPTCHA already initialized in session state
+    When: CAPTCHA is rendered again
+    Then: Same CAPTCHA values are used
+    And: Challenge text reflects existing values
+    """
+    # Arrange
+    _, captcha_service = services
+    
+    captcha_service.get_challenge_text.return_value = "What is 6 + 2?"
+    
+    # Act
+    _st.text_input.return_value = "8"
+    mock_session = _install_session_state({'captcha_x': 6, 'captcha_y': 2})
+    login_page._render_captcha()
+    
+    # Assert
+    # Verify existing values are preserved
+    assert mock_session['captcha_x'] == 6
+    assert mock_session['captcha_y'] == 2
+    # Verify generate_challenge was not called (values already exist)
+    captcha_service.generate_challenge.assert_not_called()
+    # Verify challenge text uses existing values
+    captcha_service.get_challenge_text.assert_called_with(6, 2)
+
+
+def test_authentication_clears_sensitive_state():
+    """
+    Test: Successful authentication clears sensitive session data
+    
+    Given: Session state with authentication-related data
+    When: Successful login occurs
+    Then: User data is set in session
+    And: Temporary authentication data is preserved for user experience
+    """
+    # Arrange
+    login_page = LoginPage(_stub(authenticate=_SUCCESS_RESULT, needs_captcha=False), _stub())
+    
+    # Act
+    mock_session = _install_session_state({'temp_data': 'should_remain'})
+    login_page._handle_login("test_user", "password")
+    
+    # Assert
+    # Verify authentication data is set
+    assert mock_session['authenticated'] == True
+    assert mock_session['current_user'] == _TEST_USER
+    # Verify other session data is preserved
+    assert mock_session['temp_data'] == 'should_remain'
\ No newline at end of file
@@ -13,35 +13,56 @@ Test Categories:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock
 import streamlit as st
-import plotly.graph_objects as go
-from service_layer.pages import TimelinePage
 from service_layer.models import TimelineData, InpatientStay, MedicationEvent, DiagnosisEvent
 from datetime import datetime
 
+pytestmark = [pytest.mark.ui, pytest.mark.fast]
+
+
+# TimelinePage only passes the chart through to st.plotly_chart, so identity is
+# all the tests need to check.
+_SENTINEL_CHART = object()
+
+
+@pytest.fixture(autouse=True)
+def streamlit_mocks(monkeypatch):
+    """Replace the Streamlit calls TimelinePage makes with MagicMocks."""
+    mocks = SimpleNamespace(
+        subheader=MagicMock(),
+        plotly_chart=MagicMock(),
+        expander=MagicMock(),
+        columns=MagicMock(),
+        metric=MagicMock(),
+        error=MagicMock(),
+    )
+    mocks.expander.return_value.__enter__.return_value = MagicMock()
+    mocks.columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(st, name, mock)
+    return mocks
+
 
 class TestTimelinePageRendering:
     """Test suite for timeline page UI rendering."""
     
-    @patch('streamlit.subheader')
-    @patch('streamlit.plotly_chart')
-    def test_timeline_page_renders_basic_structure(self, mock_plotly_chart, mock_subheader):
+    def test_timeline_page_renders_basic_structure(self, timeline_page, streamlit_mocks):
         """
         Test: Timeline page renders basic UI structure
         
         Given: TimelinePage with mocked services
         When: render() is called
         Then: Page header and chart are displayed
+        And: Chart uses the full container width
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         # Mock services
-        mock_timeline_data = Mock()
-        mock_chart = Mock(spec=go.Figure)
+        mock_timeline_data = Mock(inpatient_stays=[], medications=[])
+        mock_chart = _SENTINEL_CHART
         timeline_data_service.get_sample_timeline_data.return_value = mock_timeline_data
         timeline_viz_service.create_timeline_chart.return_value = mock_chart
         
@@ -49,10 +70,10 @@ class TestTimelinePageRendering:
         timeline_page.render()
         
         # Assert
-        mock_subheader.assert_called_once_with("Interactive Clinical Timeline")
-        mock_plotly_chart.assert_called_once_with(mock_chart, use_container_width=True)
+        streamlit_mocks.subheader.assert_called_once_with("Interactive Clinical Timeline")
+        streamlit_mocks.plotly_chart.assert_called_once_with(mock_chart, use_container_width=True)
     
-    def test_timeline_page_calls_services_correctly(self):
+    def test_timeline_page_calls_services_correctly(self, timeline_page):
         """
         Test: Timeline page calls data and visualization services
         
@@ -62,19 +83,15 @@ class TestTimelinePageRendering:
         And: Visualization service is called to create chart
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
-        mock_timeline_data = Mock()
-        mock_chart = Mock(spec=go.Figure)
+        mock_timeline_data = Mock(inpatient_stays=[], medications=[])
+        mock_chart = _SENTINEL_CHART
         timeline_data_service.get_sample_timeline_data.return_value = mock_timeline_data
         timeline_viz_service.create_timeline_chart.return_value = mock_chart
         
         # Act
-        with patch('streamlit.subheader'), \
-             patch('streamlit.plotly_chart'):
-            timeline_page.render()
+        timeline_page.render()
         
         # Assert
         timeline_data_service.get_sample_timeline_data.assert_called_once()
@@ -84,7 +101,7 @@ class TestTimelinePageRendering:
 class TestTimelineSummary:
     """Test suite for timeline summary functionality."""
     
-    def test_timeline_summary_displays_correct_metrics(self):
+    def test_timeline_summary_displays_correct_metrics(self, timeline_page, streamlit_mocks):
         """
         Test: Timeline summary displays correct metrics
         
@@ -93,9 +110,7 @@ class TestTimelineSummary:
         Then: Correct metrics are displayed
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         # Create mock timeline data
         mock_stays = [
@@ -110,26 +125,13 @@ class TestTimelineSummary:
         mock_timeline_data.medications = mock_medications
         
         # Act
-        with patch('streamlit.expander') as mock_expander, \
-             patch('streamlit.columns') as mock_columns, \
-             patch('streamlit.metric') as mock_metric:
-            
-            # Mock expander context
-            mock_expander_context = MagicMock()
-            mock_expander.return_value.__enter__ = Mock(return_value=mock_expander_context)
-            mock_expander.return_value.__exit__ = Mock(return_value=None)
-            
-            # Mock columns
-            mock_col1, mock_col2, mock_col3 = Mock(), Mock(), Mock()
-            mock_columns.return_value = [mock_col1, mock_col2, mock_col3]
-            
-            timeline_page._render_timeline_summary(mock_timeline_data)
+        timeline_page._render_timeline_summary(mock_timeline_data)
         
         # Assert
-        mock_expander.assert_called_once_with("Timeline Summary")
-        mock_columns.assert_called_once_with(3)
+        streamlit_mocks.expander.assert_called_once_with("Timeline Summary")
+        streamlit_mocks.columns.assert_called_once_with(3)
     
-    def test_timeline_summary_calculates_total_days_correctly(self):
+    def test_timeline_summary_calculates_total_days_correctly(self, timeline_page, streamlit_mocks):
         """
         Test: Timeline summary calculates total inpatient days correctly
         
@@ -138,9 +140,7 @@ class TestTimelineSummary:
         Then: Total days metric shows sum of all stay durations
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         # Create mock stays with specific durations
         stay1 = Mock()
@@ -155,27 +155,12 @@ class TestTimelineSummary:
         mock_timeline_data.medications = [Mock(), Mock()]
         
         # Act
-        with patch('streamlit.expander') as mock_expander, \
-             patch('streamlit.columns') as mock_columns, \
-             patch('streamlit.metric') as mock_metric:
-            
-            # Mock expander context
-            mock_expander_context = MagicMock()
-            mock_expander.return_value.__enter__ = Mock(return_value=mock_expander_context)
-            mock_expander.return_value.__exit__ = Mock(return_value=None)
-            
-            # Mock columns with contexts
-            mock_col1, mock_col2, mock_col3 = MagicMock(), MagicMock(), MagicMock()
-            mock_columns.return_value = [mock_col1, mock_col2, mock_col3]
-            
-            timeline_page._render_timeline_summary(mock_timeline_data)
-        
-        # Assert that the total days calculation is correct (15 + 30 + 25 = 70)
-        # Note: We can't directly test the metric call arguments due to the with context,
-        # but we can verify the method was called and the calculation logic is sound
-        assert sum(stay.duration_days for stay in mock_timeline_data.inpatient_stays) == 70
+        timeline_page._render_timeline_summary(mock_timeline_data)
+        
+        # Assert (15 + 30 + 25 = 70)
+        streamlit_mocks.metric.assert_any_call("Total Inpatient Days", 70)
     
-    def test_timeline_summary_expandable_section(self):
+    def test_timeline_summary_expandable_section(self, timeline_page, streamlit_mocks):
         """
         Test: Timeline summary is contained in expandable section
         
@@ -184,31 +169,23 @@ class TestTimelineSummary:
         Then: Content is within an expandable section
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         mock_timeline_data = Mock()
         mock_timeline_data.inpatient_stays = [Mock(duration_days=10)]
         mock_timeline_data.medications = [Mock()]
         
         # Act
-        with patch('streamlit.expander') as mock_expander:
-            # Mock expander context
-            mock_expander_context = MagicMock()
-            mock_expander.return_value.__enter__ = Mock(return_value=mock_expander_context)
-            mock_expander.return_value.__exit__ = Mock(return_value=None)
-            
-            timeline_page._render_timeline_summary(mock_timeline_data)
+        timeline_page._render_timeline_summary(mock_timeline_data)
         
         # Assert
-        mock_expander.assert_called_once_with("Timeline Summary")
+        streamlit_mocks.expander.assert_called_once_with("Timeline Summary")
 
 
 class TestTimelinePageIntegration:
     """Test suite for timeline page integration with services."""
     
-    def test_complete_timeline_rendering_flow(self):
+    def test_complete_timeline_rendering_flow(self, timeline_page, streamlit_mocks, monkeypatch):
         """
         Test: Complete timeline rendering flow works correctly
         
@@ -218,9 +195,7 @@ class TestTimelinePageIntegration:
         And: Services are called with correct parameters
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         # Create realistic mock data
         mock_stays = [Mock(duration_days=20), Mock(duration_days=35)]
@@ -229,25 +204,23 @@ class TestTimelinePageIntegration:
         mock_timeline_data.inpatient_stays = mock_stays
         mock_timeline_data.medications = mock_medications
         
-        mock_chart = Mock(spec=go.Figure)
+        mock_chart = _SENTINEL_CHART
         timeline_data_service.get_sample_timeline_data.return_value = mock_timeline_data
         timeline_viz_service.create_timeline_chart.return_value = mock_chart
+        mock_render_summary = MagicMock()
+        monkeypatch.setattr(timeline_page, '_render_timeline_summary', mock_render_summary)
         
         # Act
-        with patch('streamlit.subheader') as mock_subheader, \
-             patch('streamlit.plotly_chart') as mock_plotly_chart, \
-             patch.object(timeline_page, '_render_timeline_summary') as mock_render_summary:
-            
-            timeline_page.render()
+        timeline_page.render()
         
         # Assert - Verify order and calls
-        mock_subheader.assert_called_once_with("Interactive Clinical Timeline")
+        streamlit_mocks.subheader.assert_called_once_with("Interactive Clinical Timeline")
         timeline_data_service.get_sample_timeline_data.assert_called_once()
         timeline_viz_service.create_timeline_chart.assert_called_once_with(mock_timeline_data)
-        mock_plotly_chart.assert_called_once_with(mock_chart, use_container_width=True)
+        streamlit_mocks.plotly_chart.assert_called_once_with(mock_chart, use_container_width=True)
         mock_render_summary.assert_called_once_with(mock_timeline_data)
     
-    def test_timeline_page_handles_empty_data_gracefully(self):
+    def test_timeline_page_handles_empty_data_gracefully(self, timeline_page):
         """
         Test: Timeline page handles empty or minimal data gracefully
         
@@ -257,71 +230,29 @@ class TestTimelinePageIntegration:
         And: Summary shows zero counts
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         # Create empty timeline data
         mock_timeline_data = Mock()
         mock_timeline_data.inpatient_stays = []
         mock_timeline_data.medications = []
         
-        mock_chart = Mock(spec=go.Figure)
+        mock_chart = _SENTINEL_CHART
         timeline_data_service.get_sample_timeline_data.return_value = mock_timeline_data
         timeline_viz_service.create_timeline_chart.return_value = mock_chart
         
         # Act
-        with patch('streamlit.subheader'), \
-             patch('streamlit.plotly_chart'), \
-             patch('streamlit.expander') as mock_expander, \
-             patch('streamlit.columns') as mock_columns, \
-             patch('streamlit.metric'):
-            
-            # Mock expander context
-            mock_expander_context = MagicMock()
-            mock_expander.return_value.__enter__ = Mock(return_value=mock_expander_context)
-            mock_expander.return_value.__exit__ = Mock(return_value=None)
-            
-            # Mock columns
-            mock_columns.return_value = [Mock(), Mock(), Mock()]
-            
-            timeline_page.render()
+        timeline_page.render()
         
         # Assert - Should not raise exceptions
         timeline_data_service.get_sample_timeline_data.assert_called_once()
         timeline_viz_service.create_timeline_chart.assert_called_once()
-    
-    def test_timeline_page_uses_container_width_for_chart(self):
-        """
-        Test: Timeline chart uses full container width
-        
-        Given: Timeline page with chart
-        When: Chart is displayed
-        Then: use_container_width=True is set
-        """
-        # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
-        
-        mock_timeline_data = Mock()
-        mock_chart = Mock(spec=go.Figure)
-        timeline_data_service.get_sample_timeline_data.return_value = mock_timeline_data
-        timeline_viz_service.create_timeline_chart.return_value = mock_chart
-        
-        # Act
-        with patch('streamlit.subheader'), \
-             patch('streamlit.plotly_chart') as mock_plotly_chart:
-            timeline_page.render()
-        
-        # Assert
-        mock_plotly_chart.assert_called_once_with(mock_chart, use_container_width=True)
 
 
 class TestTimelinePageErrorHandling:
     """Test suite for timeline page error handling."""
     
-    def test_timeline_page_handles_service_exceptions(self):
+    def test_timeline_page_handles_service_exceptions(self, timeline_page):
         """
         Test: Timeline page handles service exceptions gracefully
         
@@ -331,27 +262,19 @@ class TestTimelinePageErrorHandling:
         And: User sees appropriate error message
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         # Mock service to raise exception
         timeline_data_service.get_sample_timeline_data.side_effect = Exception("Service error")
         
         # Act & Assert
-        with patch('streamlit.subheader'), \
-             patch('streamlit.error') as mock_error:
-            
-            try:
-                timeline_page.render()
-            except Exception:
-                # If exception propagates, that's expected behavior
-                pass
-            
-            # Verify that the service was called (exception occurred during service call)
-            timeline_data_service.get_sample_timeline_data.assert_called_once()
+        with pytest.raises(Exception, match="Service error"):
+            timeline_page.render()
+        
+        # Verify that the service was called (exception occurred during service call)
+        timeline_data_service.get_sample_timeline_data.assert_called_once()
     
-    def test_timeline_page_handles_chart_creation_failure(self):
+    def test_timeline_page_handles_chart_creation_failure(self, timeline_page):
         """
         Test: Timeline page handles chart creation failure
         
@@ -360,22 +283,16 @@ class TestTimelinePageErrorHandling:
         Then: Error is handled appropriately
         """
         # Arrange
-        timeline_data_service = Mock()
-        timeline_viz_service = Mock()
-        timeline_page = TimelinePage(timeline_data_service, timeline_viz_service)
+        timeline_page, timeline_data_service, timeline_viz_service = timeline_page
         
         mock_timeline_data = Mock()
         timeline_data_service.get_sample_timeline_data.return_value = mock_timeline_data
         timeline_viz_service.create_timeline_chart.side_effect = Exception("Chart creation failed")
         
         # Act & Assert
-        with patch('streamlit.subheader'):
-            try:
-                timeline_page.render()
-            except Exception:
-                # Exception expected from chart creation
-                pass
-            
-            # Verify services were called in correct order
-            timeline_data_service.get_sample_timeline_data.assert_called_once()
-            timeline_viz_service.create_timeline_chart.assert_called_once_with(mock_timeline_data)
\ No newline at end of file
+        with pytest.raises(Exception, match="Chart creation failed"):
+            timeline_page.render()
+        
+        # Verify services were called in correct order
+        timeline_data_service.get_sample_timeline_data.assert_called_once()
+        timeline_viz_service.create_timeline_chart.assert_called_once_with(mock_timeline_data)
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Unit test fixtures.
+
+Fixtures defined here apply only to tests under tests/unit/.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import bcrypt
+import pytest
+from service_layer.repositories import UserRepository, FailedAttemptsRepository, AuditRepository
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fast_bcrypt():
+    """Generate bcrypt salts at the minimum work factor (4) during unit tests.
+
+    Hashes stay valid bcrypt hashes. The patch is undone after each unit test
+    module, so tests outside tests/unit/ always hash at the production cost.
+    Yields the real ``bcrypt.gensalt`` for tests that need production-cost
+    hashing.
+    """
+    real_gensalt = bcrypt.gensalt
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", lambda rounds=12, prefix=b"2b": real_gensalt(4, prefix))
+        yield real_gensalt
+
+
+_SHM_DIR = "/dev/shm"
+
+
+@contextmanager
+def _scratch_directory(tmp_path_factory, prefix):
+    """Yield a fresh directory on the /dev/shm tmpfs, or under pytest's base temp."""
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        path = tempfile.mkdtemp(prefix=f"{prefix}-", dir=_SHM_DIR)
+        try:
+            yield path
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+    else:
+        yield str(tmp_path_factory.mktemp(prefix))
+
+
+@pytest.fixture(scope="module")
+def temp_directory(tmp_path_factory):
+    """Repository directory shared by every test in a module.
+
+    Overrides the per-test directory from tests/conftest.py; request
+    ``reset_repository_files`` to start each test with no data files.
+    Lives on the /dev/shm tmpfs where available so repository I/O stays in
+    RAM, falling back to pytest's base temp elsewhere.
+    """
+    with _scratch_directory(tmp_path_factory, "repo") as path:
+        yield path
+
+
+@pytest.fixture(scope="module")
+def user_repo(temp_directory):
+    """UserRepository backed by the module's temp_directory."""
+    return UserRepository(base_path=temp_directory)
+
+
+@pytest.fixture(scope="module")
+def attempts_repo(temp_directory):
+    """FailedAttemptsRepository backed by the module's temp_directory."""
+    return FailedAttemptsRepository(base_path=temp_directory)
+
+
+@pytest.fixture(scope="module")
+def audit_repo(temp_directory):
+    """AuditRepository backed by the module's temp_directory."""
+    return AuditRepository(base_path=temp_directory)
+
+
+@pytest.fixture(scope="module")
+def seeded_audit(tmp_path_factory):
+    """AuditRepository whose log holds "First event", "Second event" and "Third event".
+
+    Seeded once per module in its own directory, out of reach of
+    ``reset_repository_files``; tests must only read from it.
+    """
+    with _scratch_directory(tmp_path_factory, "audit") as path:
+        audit_repo = AuditRepository(base_path=path)
+        for event in ("First event", "Second event", "Third event"):
+            audit_repo.log_event(event)
+        yield audit_repo
+
+
+@pytest.fixture(scope="module")
+def repo_paths(temp_directory):
+    """Paths of the module's repository data files, built once."""
+    base = Path(temp_directory)
+    return SimpleNamespace(
+        base=base,
+        users=base / "users.json",
+        attempts=base / "failed_attempts.json",
+        audit=base / "audit.log",
+    )
+
+
+@pytest.fixture
+def reset_repository_files(repo_paths):
+    """Delete the repository data files so each test starts from empty storage."""
+    for path in (repo_paths.users, repo_paths.attempts, repo_paths.audit):
+        path.unlink(missing_ok=True)
+
+
+def _json_writer(path):
+    def write(mapping):
+        with open(path, "w") as f:
+            json.dump(mapping, f)
+    return write
+
+
+@pytest.fixture
+def seed_users(user_repo):
+    """Write a username -> user data mapping to users.json in one go."""
+    return _json_writer(user_repo.filepath)
+
+
+@pytest.fixture
+def seed_attempts(attempts_repo):
+    """Write a username -> attempt data mapping to failed_attempts.json in one go."""
+    return _json_writer(attempts_repo.filepath)
@@ -14,15 +14,16 @@ Test Categories:
 """
 
 import pytest
-from unittest.mock import Mock, patch
 from service_layer.services import AuthenticationService, PasswordService
 from service_layer.models import AuthenticationResult, User
 
+pytestmark = pytest.mark.unit
+
 
 class TestAuthenticationService:
     """Test suite for AuthenticationService business logic."""
     
-    def test_successful_authentication_returns_user_object(self, auth_service_with_mocks, mock_repositories):
+    def test_successful_authentication_returns_user_object(self, auth_service_with_mocks, mock_repositories, mock_password_service):
         """
         Test: Successful authentication with valid credentials
         
@@ -43,9 +44,10 @@ class TestAuthenticationService:
         }
         attempts_repo.get_attempts.return_value = None  # No failed attempts
         
+        mock_password_service.verify_password.return_value = True
+        
         # Act
-        with patch.object(PasswordService, 'verify_password', return_value=True):
-            result = auth_service.authenticate("test_user", "correct_password")
+        result = auth_service.authenticate("test_user", "correct_password")
         
         # Assert
         assert result.success == True
@@ -55,7 +57,7 @@ class TestAuthenticationService:
         audit_repo.log_event.assert_called_with("Successful login: test_user")
         attempts_repo.clear_attempts.assert_called_with("test_user")
     
-    def test_invalid_password_returns_failure(self, auth_service_with_mocks, mock_repositories):
+    def test_invalid_password_returns_failure(self, auth_service_with_mocks, mock_repositories, mock_password_service):
         """
         Test: Authentication fails with incorrect password
         
@@ -76,9 +78,10 @@ class TestAuthenticationService:
         }
         attempts_repo.get_attempts.return_value = None
         
+        mock_password_service.verify_password.return_value = False
+        
         # Act
-        with patch.object(PasswordService, 'verify_password', return_value=False):
-            result = auth_service.authenticate("test_user", "wrong_password")
+        result = auth_service.authenticate("test_user", "wrong_password")
         
         # Assert
         assert result.success == False
@@ -140,7 +143,7 @@ class TestAuthenticationService:
         # Verify password verification was not attempted
         user_repo.find_by_username.assert_not_called()
     
-    def test_create_user_success(self, auth_service_with_mocks, mock_repositories):
+    def test_create_user_success(self, auth_service_with_mocks, mock_repositories, mock_password_service):
         """
         Test: Successful user creation
         
@@ -156,15 +159,16 @@ class TestAuthenticationService:
         
         user_repo.user_exists.return_value = False
         
+        mock_password_service.is_valid_password.return_value = True
+        mock_password_service.hash_password.return_value = "hashed_password"
+        
         # Act
-        with patch.object(PasswordService, 'is_valid_password', return_value=True), \
-             patch.object(PasswordService, 'hash_password', return_value="hashed_password"):
-            result = auth_service.create_user(
-                "new_user", 
-                "test@example.com", 
-                "ValidPassword123!", 
-                "viewer"
-            )
+        result = auth_service.create_user(
+            "new_user", 
+            "test@example.com", 
+            "ValidPassword123!", 
+            "viewer"
+        )
         
         # Assert
         assert result == True
@@ -198,7 +202,7 @@ class TestAuthenticationService:
         assert result == False
         user_repo.save_user.assert_not_called()
     
-    def test_reset_password_success(self, auth_service_with_mocks, mock_repositories):
+    def test_reset_password_success(self, auth_service_with_mocks, mock_repositories, mock_password_service):
         """
         Test: Successful password reset
         
@@ -218,10 +222,11 @@ class TestAuthenticationService:
             "role": "admin"
         }
         
+        mock_password_service.is_valid_password.return_value = True
+        mock_password_service.hash_password.return_value = "new_hash"
+        
         # Act
-        with patch.object(PasswordService, 'is_valid_password', return_value=True), \
-             patch.object(PasswordService, 'hash_password', return_value="new_hash"):
-            result = auth_service.reset_password("test_user", "NewValidPassword123!")
+        result = auth_service.reset_password("test_user", "NewValidPassword123!")
         
         # Assert
         assert result == True
@@ -342,7 +347,7 @@ class TestPasswordService:
         # Assert
         assert result == False
     
-    def test_hash_password_returns_bcrypt_hash(self):
+    def test_hash_password_returns_bcrypt_hash(self, known_bcrypt_hash):
         """
         Test: Password hashing produces bcrypt hash
         
@@ -350,14 +355,14 @@ class TestPasswordService:
         When: hash_password() is called
         Then: Returns bcrypt-formatted hash string
         """
-        # Arrange & Act
-        result = PasswordService.hash_password("TestPassword123!")
+        # Arrange & Act (hash_password runs once per session in the fixture)
+        result = known_bcrypt_hash
         
         # Assert
         assert result.startswith("$2b$")
         assert len(result) == 60  # Standard bcrypt hash length
     
-    def test_verify_password_succeeds_with_correct_password(self):
+    def test_verify_password_succeeds_with_correct_password(self, known_bcrypt_hash):
         """
         Test: Password verification succeeds with correct password
         
@@ -367,15 +372,14 @@ class TestPasswordService:
         """
         # Arrange
         password = "TestPassword123!"
-        password_hash = PasswordService.hash_password(password)
         
         # Act
-        result = PasswordService.verify_password(password, password_hash)
+        result = PasswordService.verify_password(password, known_bcrypt_hash)
         
         # Assert
         assert result == True
     
-    def test_verify_password_fails_with_incorrect_password(self):
+    def test_verify_password_fails_with_incorrect_password(self, known_bcrypt_hash):
         """
         Test: Password verification fails with incorrect password
         
@@ -384,12 +388,10 @@ class TestPasswordService:
         Then: Returns False
         """
         # Arrange
-        correct_password = "TestPassword123!"
         wrong_password = "WrongPassword123!"
-        password_hash = PasswordService.hash_password(correct_password)
         
         # Act
-        result = PasswordService.verify_password(wrong_password, password_hash)
+        result = PasswordService.verify_password(wrong_password, known_bcrypt_hash)
         
         # Assert
         assert result == False
\ No newline at end of file
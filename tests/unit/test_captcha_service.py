@@ -10,15 +10,27 @@ Test Categories:
 2. Answer validation
 3. Text formatting
 4. Edge cases and error handling
+
+PYTEST_DONT_REWRITE: every assertion here is a plain equality or truth
+check, so pytest's assertion rewriting is skipped for this module.
 """
 
 import pytest
+from unittest.mock import Mock
 from service_layer.services import CaptchaService
+from service_layer.services import captcha_service as captcha_module
+
+pytestmark = pytest.mark.unit
 
 
 class TestCaptchaService:
     """Test suite for CAPTCHA generation and validation."""
     
+    @pytest.fixture
+    def validate(self, captcha_service):
+        """Bound validate_answer of the shared service, for the parametrized cases."""
+        return captcha_service.validate_answer
+    
     def test_generate_challenge_returns_two_integers(self, captcha_service):
         """
         Test: Challenge generation produces two random integers
@@ -37,21 +49,25 @@ class TestCaptchaService:
         assert 1 <= x <= 9
         assert 1 <= y <= 9
     
-    def test_generate_challenge_produces_different_values(self, captcha_service):
+    def test_generate_challenge_produces_different_values(self, captcha_service, monkeypatch):
         """
-        Test: Multiple challenge generations produce varied results
+        Test: Each challenge generation draws fresh random values
         
-        Given: CaptchaService instance
+        Given: CaptchaService with random.randint returning a known sequence
         When: generate_challenge() is called multiple times
-        Then: At least some challenges are different
-        (Note: Small chance of false positive due to randomness)
+        Then: Each challenge is built from the next two draws in 1..9
         """
-        # Act - Generate multiple challenges
-        challenges = [captcha_service.generate_challenge() for _ in range(20)]
+        # Arrange
+        randint = Mock(side_effect=[1, 2, 3, 4, 5, 6, 7, 8])
+        monkeypatch.setattr(captcha_module.random, "randint", randint)
+        
+        # Act
+        challenges = [captcha_service.generate_challenge() for _ in range(4)]
         
-        # Assert - Should have some variety (not all identical)
-        unique_challenges = set(challenges)
-        assert len(unique_challenges) > 1
+        # Assert
+        assert challenges == [(1, 2), (3, 4), (5, 6), (7, 8)]
+        randint.assert_called_with(1, 9)
+        assert randint.call_count == 8
     
     def test_get_challenge_text_formats_correctly(self, captcha_service):
         """
@@ -70,118 +86,34 @@ class TestCaptchaService:
         
         # Assert
         assert challenge_text == "What is 3 + 7?"
-        assert str(x) in challenge_text
-        assert str(y) in challenge_text
-        assert "+" in challenge_text
-        assert "?" in challenge_text
     
-    def test_validate_answer_succeeds_with_correct_answer(self, captcha_service):
-        """
-        Test: Answer validation succeeds with correct sum
-        
-        Given: Challenge numbers and correct sum as string
+    @pytest.mark.parametrize("x,y,answer,expected", [
+        (4, 6, "10", True),
+        (4, 6, "9", False),
+        (4, 6, "abc", False),
+        (4, 6, "", False),
+        (4, 6, None, False),
+        (5, 3, str(8), True),
+        (2, 9, "  11  ", True),  # int() strips whitespace automatically
+        (9, 9, "18", True),
+        (1, 1, "2", True),
+    ], ids=["correct", "wrong", "nonnumeric", "empty", "none", "int", "whitespace", "max", "min"])
+    def test_validate_answer(self, validate, x, y, answer, expected):
+        """
+        Test: Answer validation accepts only the correct sum
+        
+        Given: Challenge numbers and a candidate answer
         When: validate_answer() is called
-        Then: Returns True
+        Then: Returns True for the correct sum, including the minimum (2)
+              and maximum (18) sums and answers padded with whitespace
+        And: Returns False for wrong, non-numeric, empty or None answers
+             without raising
         """
-        # Arrange
-        x, y = 4, 6
-        correct_answer = "10"
-        
         # Act
-        result = captcha_service.validate_answer(x, y, correct_answer)
+        result = validate(x, y, answer)
         
         # Assert
-        assert result == True
-    
-    def test_validate_answer_fails_with_incorrect_answer(self, captcha_service):
-        """
-        Test: Answer validation fails with incorrect sum
-        
-        Given: Challenge numbers and incorrect sum as string
-        When: validate_answer() is called
-        Then: Returns False
-        """
-        # Arrange
-        x, y = 4, 6
-        incorrect_answer = "9"
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, incorrect_answer)
-        
-        # Assert
-        assert result == False
-    
-    def test_validate_answer_handles_non_numeric_input(self, captcha_service):
-        """
-        Test: Answer validation handles non-numeric input gracefully
-        
-        Given: Challenge numbers and non-numeric string
-        When: validate_answer() is called
-        Then: Returns False (doesn't raise exception)
-        """
-        # Arrange
-        x, y = 4, 6
-        non_numeric_answer = "abc"
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, non_numeric_answer)
-        
-        # Assert
-        assert result == False
-    
-    def test_validate_answer_handles_empty_input(self, captcha_service):
-        """
-        Test: Answer validation handles empty input gracefully
-        
-        Given: Challenge numbers and empty string
-        When: validate_answer() is called
-        Then: Returns False (doesn't raise exception)
-        """
-        # Arrange
-        x, y = 4, 6
-        empty_answer = ""
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, empty_answer)
-        
-        # Assert
-        assert result == False
-    
-    def test_validate_answer_handles_none_input(self, captcha_service):
-        """
-        Test: Answer validation handles None input gracefully
-        
-        Given: Challenge numbers and None as answer
-        When: validate_answer() is called
-        Then: Returns False (doesn't raise exception)
-        """
-        # Arrange
-        x, y = 4, 6
-        none_answer = None
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, none_answer)
-        
-        # Assert
-        assert result == False
-    
-    def test_validate_answer_accepts_integer_input(self, captcha_service):
-        """
-        Test: Answer validation accepts integer input
-        
-        Given: Challenge numbers and correct sum as integer
-        When: validate_answer() is called with integer
-        Then: Returns True
-        """
-        # Arrange
-        x, y = 5, 3
-        integer_answer = 8
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, str(integer_answer))
-        
-        # Assert
-        assert result == True
+        assert result == expected
     
     def test_get_expected_answer_returns_correct_sum(self, captcha_service):
         """
@@ -200,57 +132,3 @@ class TestCaptchaService:
         # Assert
         assert expected == 15
         assert expected == x + y
-    
-    def test_validate_answer_with_leading_trailing_spaces(self, captcha_service):
-        """
-        Test: Answer validation handles whitespace in input
-        
-        Given: Challenge numbers and answer with extra whitespace
-        When: validate_answer() is called
-        Then: Returns True for correct answer despite whitespace
-        """
-        # Arrange
-        x, y = 2, 9
-        answer_with_spaces = "  11  "
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, answer_with_spaces)
-        
-        # Assert
-        assert result == True  # int() strips whitespace automatically
-    
-    def test_edge_case_maximum_sum(self, captcha_service):
-        """
-        Test: CAPTCHA works correctly with maximum possible sum
-        
-        Given: Maximum challenge numbers (9, 9)
-        When: Validating maximum sum (18)
-        Then: Validation succeeds
-        """
-        # Arrange
-        x, y = 9, 9
-        max_answer = "18"
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, max_answer)
-        
-        # Assert
-        assert result == True
-    
-    def test_edge_case_minimum_sum(self, captcha_service):
-        """
-        Test: CAPTCHA works correctly with minimum possible sum
-        
-        Given: Minimum challenge numbers (1, 1)
-        When: Validating minimum sum (2)
-        Then: Validation succeeds
-        """
-        # Arrange
-        x, y = 1, 1
-        min_answer = "2"
-        
-        # Act
-        result = captcha_service.validate_answer(x, y, min_answer)
-        
-        # Assert
-        assert result == True
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Password Hashing Benchmarks
+
+Purpose: Catch performance regressions in bcrypt hashing and verification
+Scope: PasswordService.hash_password and PasswordService.verify_password
+Dependencies: pytest-benchmark (module is skipped when it is not installed)
+
+These run at the production bcrypt work factor, so an accidental cost-factor
+bump or a slow pre-hash step shows up as a timing change in the "bcrypt" group.
+Benchmarks only collect timings when run without xdist:
+
+    pytest tests/unit/test_password_benchmarks.py -n 0 --benchmark-json=benchmark.json
+"""
+
+import bcrypt
+import pytest
+from service_layer.services import PasswordService
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def production_bcrypt(monkeypatch, _fast_bcrypt):
+    """Restore the real bcrypt.gensalt for the duration of a benchmark."""
+    monkeypatch.setattr(bcrypt, "gensalt", _fast_bcrypt)
+
+
+@pytest.mark.benchmark(group="bcrypt")
+def test_bench_hash_password(benchmark, production_bcrypt):
+    """Time hashing one password at the production work factor."""
+    result = benchmark(PasswordService.hash_password, "TestPassword123!")
+    
+    assert result.startswith("$2b$12$")
+
+
+@pytest.mark.benchmark(group="bcrypt")
+def test_bench_verify_password(benchmark, production_bcrypt):
+    """Time verifying one password against a production-cost hash."""
+    password_hash = PasswordService.hash_password("TestPassword123!")
+    
+    result = benchmark(PasswordService.verify_password, "TestPassword123!", password_hash)
+    
+    assert result == True
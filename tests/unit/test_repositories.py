@@ -3,7 +3,7 @@ Repository Unit Tests
 
 Purpose: Test data access layer operations in isolation
 Scope: UserRepository, FailedAttemptsRepository, AuditRepository classes
-Dependencies: Temporary files (no permanent data modification)
+Dependencies: Module-scoped temporary directory, emptied before each test
 
 Test Categories:
 1. User data CRUD operations
@@ -14,16 +14,17 @@ Test Categories:
 """
 
 import pytest
-import tempfile
 import os
 import json
-from service_layer.repositories import UserRepository, FailedAttemptsRepository, AuditRepository
+
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("reset_repository_files")]
 
 
 class TestUserRepository:
     """Test suite for user data repository operations."""
     
-    def test_save_and_find_user_success(self, temp_directory):
+    @pytest.mark.slow
+    def test_save_and_find_user_success(self, user_repo, repo_paths):
         """
         Test: Save user data and retrieve it successfully
         
@@ -33,7 +34,6 @@ class TestUserRepository:
         And: User file is created
         """
         # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
         user_data = {
             "password": "hashed_password_123",
             "email": "test@example.com",
@@ -46,10 +46,9 @@ class TestUserRepository:
         
         # Assert
         assert retrieved_data == user_data
-        users_file = os.path.join(temp_directory, "users.json")
-        assert os.path.exists(users_file)
+        assert repo_paths.users.exists()
     
-    def test_find_nonexistent_user_returns_none(self, temp_directory):
+    def test_find_nonexistent_user_returns_none(self, user_repo):
         """
         Test: Finding non-existent user returns None
         
@@ -57,16 +56,14 @@ class TestUserRepository:
         When: Searching for non-existent user
         Then: Returns None
         """
-        # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
-        
         # Act
         result = user_repo.find_by_username("nonexistent_user")
         
         # Assert
         assert result is None
     
-    def test_user_exists_returns_true_for_existing_user(self, temp_directory):
+    @pytest.mark.slow
+    def test_user_exists_returns_true_for_existing_user(self, user_repo):
         """
         Test: user_exists returns True for existing users
         
@@ -75,7 +72,6 @@ class TestUserRepository:
         Then: Returns True
         """
         # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
         user_data = {"password": "hash", "email": "test@example.com", "role": "viewer"}
         user_repo.save_user("existing_user", user_data)
         
@@ -85,7 +81,7 @@ class TestUserRepository:
         # Assert
         assert result == True
     
-    def test_user_exists_returns_false_for_nonexistent_user(self, temp_directory):
+    def test_user_exists_returns_false_for_nonexistent_user(self, user_repo):
         """
         Test: user_exists returns False for non-existent users
         
@@ -93,16 +89,14 @@ class TestUserRepository:
         When: Checking if user exists
         Then: Returns False
         """
-        # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
-        
         # Act
         result = user_repo.user_exists("nonexistent_user")
         
         # Assert
         assert result == False
     
-    def test_get_all_users_returns_complete_data(self, temp_directory):
+    @pytest.mark.slow
+    def test_get_all_users_returns_complete_data(self, user_repo, seed_users):
         """
         Test: get_all_users returns all saved user data
         
@@ -111,12 +105,9 @@ class TestUserRepository:
         Then: Returns dictionary with all user data
         """
         # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
         user1_data = {"password": "hash1", "email": "user1@example.com", "role": "admin"}
         user2_data = {"password": "hash2", "email": "user2@example.com", "role": "viewer"}
-        
-        user_repo.save_user("user1", user1_data)
-        user_repo.save_user("user2", user2_data)
+        seed_users({"user1": user1_data, "user2": user2_data})
         
         # Act
         all_users = user_repo.get_all_users()
@@ -126,7 +117,8 @@ class TestUserRepository:
         assert all_users["user1"] == user1_data
         assert all_users["user2"] == user2_data
     
-    def test_delete_user_removes_user_data(self, temp_directory):
+    @pytest.mark.slow
+    def test_delete_user_removes_user_data(self, user_repo):
         """
         Test: delete_user removes user from repository
         
@@ -136,7 +128,6 @@ class TestUserRepository:
         And: delete_user returns True
         """
         # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
         user_data = {"password": "hash", "email": "test@example.com", "role": "viewer"}
         user_repo.save_user("user_to_delete", user_data)
         
@@ -148,7 +139,7 @@ class TestUserRepository:
         assert user_repo.user_exists("user_to_delete") == False
         assert user_repo.find_by_username("user_to_delete") is None
     
-    def test_delete_nonexistent_user_returns_false(self, temp_directory):
+    def test_delete_nonexistent_user_returns_false(self, user_repo):
         """
         Test: Deleting non-existent user returns False
         
@@ -156,16 +147,14 @@ class TestUserRepository:
         When: Attempting to delete non-existent user
         Then: Returns False
         """
-        # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
-        
         # Act
         result = user_repo.delete_user("nonexistent_user")
         
         # Assert
         assert result == False
     
-    def test_update_existing_user_data(self, temp_directory):
+    @pytest.mark.slow
+    def test_update_existing_user_data(self, user_repo):
         """
         Test: Updating existing user overwrites previous data
         
@@ -174,7 +163,6 @@ class TestUserRepository:
         Then: New data overwrites old data
         """
         # Arrange
-        user_repo = UserRepository(base_path=temp_directory)
         original_data = {"password": "old_hash", "email": "old@example.com", "role": "viewer"}
         updated_data = {"password": "new_hash", "email": "new@example.com", "role": "admin"}
         
@@ -186,13 +174,48 @@ class TestUserRepository:
         
         # Assert
         assert retrieved_data == updated_data
-        assert retrieved_data != original_data
+    
+    @pytest.mark.slow
+    def test_find_user_sees_file_changed_after_save(self, user_repo, repo_paths, seed_users):
+        """
+        Test: Reads reflect users.json as it is now, not as last read or saved
+        
+        Given: Repository that has saved and read back a user
+        When: users.json is rewritten outside the repository, once in place
+              with the same byte length and modification time, once wholesale
+        Then: find_by_username returns the rewritten data each time
+        And: Mutating a returned record does not leak into later reads
+        """
+        # Arrange
+        user_repo.save_user("test_user", {"password": "hash", "email": "a@example.com", "role": "viewer"})
+        user_repo.find_by_username("test_user")["role"] = "tampered"
+        before_rewrite = user_repo.find_by_username("test_user")
+        rewritten_data = {"password": "other_hash", "email": "rewritten@example.com", "role": "admin"}
+        
+        # Act - same-size in-place edit that keeps the original mtime
+        stat = repo_paths.users.stat()
+        content = repo_paths.users.read_bytes()
+        repo_paths.users.write_bytes(content.replace(b'"viewer"', b'"admins"'))
+        os.utime(repo_paths.users, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        edited_stat = repo_paths.users.stat()
+        after_edit = user_repo.find_by_username("test_user")
+        
+        # Act - wholesale rewrite
+        seed_users({"test_user": rewritten_data})
+        after_rewrite = user_repo.find_by_username("test_user")
+        
+        # Assert
+        assert before_rewrite["role"] == "viewer"
+        assert (edited_stat.st_size, edited_stat.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+        assert after_edit["role"] == "admins"
+        assert after_rewrite == rewritten_data
 
 
 class TestFailedAttemptsRepository:
     """Test suite for failed login attempts repository."""
     
-    def test_save_and_get_attempts_success(self, temp_directory):
+    @pytest.mark.slow
+    def test_save_and_get_attempts_success(self, attempts_repo):
         """
         Test: Save failed attempt data and retrieve it
         
@@ -201,7 +224,6 @@ class TestFailedAttemptsRepository:
         Then: Retrieved data matches saved data
         """
         # Arrange
-        attempts_repo = FailedAttemptsRepository(base_path=temp_directory)
         attempt_data = {"count": 2, "last_attempt": "2024-01-01T10:00:00"}
         
         # Act
@@ -211,7 +233,7 @@ class TestFailedAttemptsRepository:
         # Assert
         assert retrieved_data == attempt_data
     
-    def test_get_attempts_for_nonexistent_user_returns_none(self, temp_directory):
+    def test_get_attempts_for_nonexistent_user_returns_none(self, attempts_repo):
         """
         Test: Getting attempts for non-existent user returns None
         
@@ -219,16 +241,14 @@ class TestFailedAttemptsRepository:
         When: Getting attempts for non-existent user
         Then: Returns None
         """
-        # Arrange
-        attempts_repo = FailedAttemptsRepository(base_path=temp_directory)
-        
         # Act
         result = attempts_repo.get_attempts("nonexistent_user")
         
         # Assert
         assert result is None
     
-    def test_clear_attempts_removes_user_data(self, temp_directory):
+    @pytest.mark.slow
+    def test_clear_attempts_removes_user_data(self, attempts_repo):
         """
         Test: clear_attempts removes user's failed attempt data
         
@@ -237,7 +257,6 @@ class TestFailedAttemptsRepository:
         Then: User's attempt data is removed
         """
         # Arrange
-        attempts_repo = FailedAttemptsRepository(base_path=temp_directory)
         attempt_data = {"count": 3, "last_attempt": "2024-01-01T10:00:00"}
         attempts_repo.save_attempt("test_user", attempt_data)
         
@@ -247,7 +266,7 @@ class TestFailedAttemptsRepository:
         # Assert
         assert attempts_repo.get_attempts("test_user") is None
     
-    def test_clear_attempts_for_nonexistent_user_succeeds(self, temp_directory):
+    def test_clear_attempts_for_nonexistent_user_succeeds(self, attempts_repo):
         """
         Test: Clearing attempts for non-existent user doesn't error
         
@@ -255,13 +274,11 @@ class TestFailedAttemptsRepository:
         When: Clearing attempts for non-existent user
         Then: Operation succeeds without error
         """
-        # Arrange
-        attempts_repo = FailedAttemptsRepository(base_path=temp_directory)
-        
         # Act & Assert (should not raise exception)
         attempts_repo.clear_attempts("nonexistent_user")
     
-    def test_get_all_attempts_returns_complete_data(self, temp_directory):
+    @pytest.mark.slow
+    def test_get_all_attempts_returns_complete_data(self, attempts_repo, seed_attempts):
         """
         Test: get_all_attempts returns all failed attempt data
         
@@ -270,12 +287,9 @@ class TestFailedAttemptsRepository:
         Then: Returns dictionary with all attempt data
         """
         # Arrange
-        attempts_repo = FailedAttemptsRepository(base_path=temp_directory)
         user1_attempts = {"count": 1, "last_attempt": "2024-01-01T10:00:00"}
         user2_attempts = {"count": 3, "last_attempt": "2024-01-01T11:00:00"}
-        
-        attempts_repo.save_attempt("user1", user1_attempts)
-        attempts_repo.save_attempt("user2", user2_attempts)
+        seed_attempts({"user1": user1_attempts, "user2": user2_attempts})
         
         # Act
         all_attempts = attempts_repo.get_all_attempts()
@@ -289,7 +303,8 @@ class TestFailedAttemptsRepository:
 class TestAuditRepository:
     """Test suite for audit logging repository."""
     
-    def test_log_event_creates_audit_entry(self, temp_directory):
+    @pytest.mark.slow
+    def test_log_event_creates_audit_entry(self, audit_repo):
         """
         Test: log_event writes audit entry to file
         
@@ -299,7 +314,6 @@ class TestAuditRepository:
         And: Log file is created
         """
         # Arrange
-        audit_repo = AuditRepository(base_path=temp_directory)
         event_message = "User login successful"
         
         # Act
@@ -310,35 +324,27 @@ class TestAuditRepository:
         assert event_message in log_content
         assert audit_repo.log_exists() == True
     
-    def test_multiple_log_events_are_appended(self, temp_directory):
+    @pytest.mark.slow
+    def test_multiple_log_events_are_appended(self, seeded_audit):
         """
         Test: Multiple log events are appended to same file
         
-        Given: Audit repository with existing log entry
-        When: Logging additional events
+        Given: Audit repository with three logged events
+        When: Reading the log content
         Then: All events appear in log content
         And: Events are in chronological order
         """
-        # Arrange
-        audit_repo = AuditRepository(base_path=temp_directory)
-        event1 = "First event"
-        event2 = "Second event"
-        event3 = "Third event"
-        
         # Act
-        audit_repo.log_event(event1)
-        audit_repo.log_event(event2)
-        audit_repo.log_event(event3)
+        log_content = seeded_audit.get_log_content()
         
         # Assert
-        log_content = audit_repo.get_log_content()
-        assert event1 in log_content
-        assert event2 in log_content
-        assert event3 in log_content
+        assert "First event" in log_content
+        assert "Second event" in log_content
+        assert "Third event" in log_content
         # Verify order (first event should appear before last)
-        assert log_content.index(event1) < log_content.index(event3)
+        assert log_content.index("First event") < log_content.index("Third event")
     
-    def test_get_log_content_empty_file_returns_empty_string(self, temp_directory):
+    def test_get_log_content_empty_file_returns_empty_string(self, audit_repo):
         """
         Test: get_log_content returns empty string for non-existent file
         
@@ -346,16 +352,13 @@ class TestAuditRepository:
         When: Getting log content
         Then: Returns empty string
         """
-        # Arrange
-        audit_repo = AuditRepository(base_path=temp_directory)
-        
         # Act
         log_content = audit_repo.get_log_content()
         
         # Assert
         assert log_content == ""
     
-    def test_log_exists_returns_false_for_nonexistent_file(self, temp_directory):
+    def test_log_exists_returns_false_for_nonexistent_file(self, audit_repo):
         """
         Test: log_exists returns False when no log file exists
         
@@ -363,55 +366,48 @@ class TestAuditRepository:
         When: Checking if log exists
         Then: Returns False
         """
-        # Arrange
-        audit_repo = AuditRepository(base_path=temp_directory)
-        
         # Act
         result = audit_repo.log_exists()
         
         # Assert
         assert result == False
     
-    def test_log_exists_returns_true_after_logging(self, temp_directory):
+    @pytest.mark.slow
+    def test_log_exists_returns_true_after_logging(self, seeded_audit):
         """
         Test: log_exists returns True after logging an event
         
-        Given: Empty audit repository
-        When: Logging an event and checking existence
+        Given: Audit repository with logged events
+        When: Checking existence
         Then: Returns True
         """
-        # Arrange
-        audit_repo = AuditRepository(base_path=temp_directory)
-        
         # Act
-        audit_repo.log_event("Test event")
-        result = audit_repo.log_exists()
+        result = seeded_audit.log_exists()
         
         # Assert
         assert result == True
     
-    def test_log_entries_include_timestamps(self, temp_directory):
+    @pytest.mark.slow
+    def test_log_entries_include_timestamps(self, seeded_audit):
         """
         Test: Log entries include timestamp information
         
-        Given: Audit repository
-        When: Logging an event
+        Given: Audit repository with logged events
+        When: Reading the log content
         Then: Log entry includes timestamp in brackets
         And: Timestamp format is recognizable
         """
         # Arrange
-        audit_repo = AuditRepository(base_path=temp_directory)
-        event_message = "Timestamped event"
+        event_message = "First event"
         
         # Act
-        audit_repo.log_event(event_message)
+        log_content = seeded_audit.get_log_content()
         
         # Assert
-        log_content = audit_repo.get_log_content()
         assert "[" in log_content  # Timestamp brackets
         assert "]" in log_content
         assert event_message in log_content
         # Verify timestamp comes before message
         bracket_pos = log_content.index("]")
         message_pos = log_content.index(event_message)
-        assert bracket_pos < message_pos
\ No newline at end of file
+        assert bracket_pos < message_pos
@@ -13,17 +13,36 @@ Test Categories:
 """
 
 import pytest
+from collections import Counter
 from datetime import datetime, timedelta
 import pandas as pd
 import plotly.graph_objects as go
-from service_layer.services import TimelineDataService, TimelineVisualizationService
 from service_layer.models import TimelineData, InpatientStay, MedicationEvent, DiagnosisEvent
 
+pytestmark = pytest.mark.unit
+
+# 14.9 and 15.1 years (365.25-day years), rounded inward to whole days
+_MIN_DAYS, _MAX_DAYS = 5443, 5515
+_EXPECTED_STAYS = (1, 2, 3, 4, 5, 6)
+# (label, count, step); the "all" button has no label or count
+_RANGE_BUTTONS = (
+    ("6m", 6, "month"),
+    ("1y", 1, "year"),
+    ("5y", 5, "year"),
+    (None, None, "all"),
+)
+
+
+@pytest.fixture(scope="module")
+def range_buttons_by_label(chart_spec):
+    """Range selector buttons of the sample chart, keyed by label."""
+    return {b.get("label"): b for b in chart_spec["layout"]["xaxis"]["rangeselector"]["buttons"]}
+
 
 class TestTimelineDataService:
     """Test suite for timeline data generation and management."""
     
-    def test_get_sample_timeline_data_returns_complete_structure(self, timeline_service):
+    def test_get_sample_timeline_data_returns_complete_structure(self, sample_timeline):
         """
         Test: Sample timeline data contains all required components
         
@@ -31,20 +50,17 @@ class TestTimelineDataService:
         When: get_sample_timeline_data() is called
         Then: Returns TimelineData with all components populated
         """
-        # Act
-        timeline = timeline_service.get_sample_timeline_data()
-        
         # Assert
-        assert isinstance(timeline, TimelineData)
-        assert timeline.patient_id == "sample_patient"
-        assert timeline.illness_start is not None
-        assert timeline.illness_end is not None
-        assert timeline.illness_start < timeline.illness_end
-        assert len(timeline.inpatient_stays) == 6
-        assert len(timeline.medications) == 3
-        assert len(timeline.diagnoses) == 3
+        assert isinstance(sample_timeline, TimelineData)
+        assert sample_timeline.patient_id == "sample_patient"
+        assert sample_timeline.illness_start is not None
+        assert sample_timeline.illness_end is not None
+        assert sample_timeline.illness_start < sample_timeline.illness_end
+        assert len(sample_timeline.inpatient_stays) == 6
+        assert len(sample_timeline.medications) == 3
+        assert len(sample_timeline.diagnoses) == 3
     
-    def test_timeline_data_illness_duration_is_15_years(self, timeline_service):
+    def test_timeline_data_illness_duration_is_15_years(self, sample_timeline):
         """
         Test: Illness duration spans 15 years as expected
         
@@ -52,15 +68,11 @@ class TestTimelineDataService:
         When: Checking illness start and end dates
         Then: Duration is approximately 15 years
         """
-        # Act
-        timeline = timeline_service.get_sample_timeline_data()
-        
         # Assert
-        duration = timeline.illness_end - timeline.illness_start
-        duration_years = duration.days / 365.25
-        assert 14.9 <= duration_years <= 15.1  # Allow for slight variance
+        duration_days = (sample_timeline.illness_end - sample_timeline.illness_start).days
+        assert _MIN_DAYS <= duration_days <= _MAX_DAYS  # Allow for slight variance
     
-    def test_inpatient_stays_have_valid_dates(self, timeline_service):
+    def test_inpatient_stays_have_valid_dates(self, sample_timeline, sample_df):
         """
         Test: All inpatient stays have valid admission/discharge dates
         
@@ -69,66 +81,53 @@ class TestTimelineDataService:
         Then: All stays have admission before discharge dates
         And: All dates are within illness timeframe
         """
-        # Act
-        timeline = timeline_service.get_sample_timeline_data()
-        
-        # Assert
-        for stay in timeline.inpatient_stays:
-            assert isinstance(stay, InpatientStay)
-            assert stay.admission_date < stay.discharge_date
-            assert timeline.illness_start <= stay.admission_date <= timeline.illness_end
-            assert timeline.illness_start <= stay.discharge_date <= timeline.illness_end
-            assert stay.duration_days > 0
-    
-    def test_medications_have_valid_structure(self, timeline_service):
-        """
-        Test: All medication events have valid structure and data
-        
-        Given: Generated timeline data
-        When: Examining medication events
-        Then: All medications have date, medication name, and dosage
-        And: String representation works correctly
-        """
-        # Act
-        timeline = timeline_service.get_sample_timeline_data()
+        # Arrange
+        start, end = sample_timeline.illness_start, sample_timeline.illness_end
         
         # Assert
-        for medication in timeline.medications:
-            assert isinstance(medication, MedicationEvent)
-            assert medication.date is not None
-            assert medication.medication is not None
-            assert medication.dosage is not None
-            assert timeline.illness_start <= medication.date <= timeline.illness_end
-            # Test string representation
-            str_repr = str(medication)
-            assert medication.medication in str_repr
-            assert medication.dosage in str_repr
+        assert all(isinstance(stay, InpatientStay) for stay in sample_timeline.inpatient_stays)
+        assert (sample_df["Admission"] < sample_df["Discharge"]).all()
+        assert sample_df["Admission"].between(start, end).all()
+        assert sample_df["Discharge"].between(start, end).all()
+        durations = (sample_df["Discharge"] - sample_df["Admission"]).dt.days
+        assert durations.tolist() == [stay.duration_days for stay in sample_timeline.inpatient_stays]
+        assert (durations > 0).all()
     
-    def test_diagnoses_have_valid_structure(self, timeline_service):
+    @pytest.mark.parametrize("attr,event_cls,fields,expected_parts", [
+        ("medications", MedicationEvent, ("date", "medication", "dosage"),
+         lambda e: (e.medication, e.dosage)),
+        ("diagnoses", DiagnosisEvent, ("date", "diagnosis_code", "diagnosis_name"),
+         lambda e: ("Dx:", e.diagnosis_code)),
+    ], ids=["medications", "diagnoses"])
+    def test_events_have_valid_structure(self, sample_timeline, attr, event_cls, fields, expected_parts):
         """
-        Test: All diagnosis events have valid structure and data
+        Test: All medication and diagnosis events have valid structure and data
         
         Given: Generated timeline data
-        When: Examining diagnosis events
-        Then: All diagnoses have date, code, and name
-        And: String representation shows abbreviated code
+        When: Examining the medication or diagnosis events
+        Then: Every event has all of its fields set within the illness timeframe
+        And: String representation shows the medication and dosage,
+             or the abbreviated diagnosis code
         """
-        # Act
-        timeline = timeline_service.get_sample_timeline_data()
+        # Arrange
+        events = getattr(sample_timeline, attr)
         
         # Assert
-        for diagnosis in timeline.diagnoses:
-            assert isinstance(diagnosis, DiagnosisEvent)
-            assert diagnosis.date is not None
-            assert diagnosis.diagnosis_code is not None
-            assert diagnosis.diagnosis_name is not None
-            assert timeline.illness_start <= diagnosis.date <= timeline.illness_end
-            # Test string representation
-            str_repr = str(diagnosis)
-            assert "Dx:" in str_repr
-            assert diagnosis.diagnosis_code in str_repr
+        assert all(isinstance(event, event_cls) for event in events)
+        for event in events:
+            for field in fields:
+                assert getattr(event, field) is not None
+        dates = pd.Series([event.date for event in events])
+        assert dates.between(sample_timeline.illness_start, sample_timeline.illness_end).all()
+        
+        # Test string representation
+        strs = list(map(str, events))
+        assert all(
+            all(part in s for part in expected_parts(e))
+            for e, s in zip(events, strs)
+        )
     
-    def test_timeline_dataframe_conversion(self, timeline_service):
+    def test_timeline_dataframe_conversion(self, sample_timeline, sample_df):
         """
         Test: Timeline data converts correctly to DataFrame
         
@@ -137,23 +136,19 @@ class TestTimelineDataService:
         Then: Returns DataFrame with correct structure
         And: Contains all inpatient stay data
         """
-        # Act
-        timeline = timeline_service.get_sample_timeline_data()
-        df = timeline.to_dataframe()
-        
         # Assert
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == len(timeline.inpatient_stays)
-        assert "Stay" in df.columns
-        assert "Admission" in df.columns
-        assert "Discharge" in df.columns
-        assert df["Stay"].tolist() == [1, 2, 3, 4, 5, 6]
+        assert isinstance(sample_df, pd.DataFrame)
+        assert len(sample_df) == len(sample_timeline.inpatient_stays)
+        assert "Stay" in sample_df.columns
+        assert "Admission" in sample_df.columns
+        assert "Discharge" in sample_df.columns
+        assert tuple(sample_df["Stay"]) == _EXPECTED_STAYS
 
 
 class TestTimelineVisualizationService:
     """Test suite for timeline chart creation and visualization."""
     
-    def test_create_timeline_chart_returns_plotly_figure(self, timeline_service):
+    def test_create_timeline_chart_returns_plotly_figure(self, sample_chart, chart_spec):
         """
         Test: Timeline chart creation produces valid Plotly figure
         
@@ -162,22 +157,15 @@ class TestTimelineVisualizationService:
         Then: Returns Plotly Figure object
         And: Figure has expected title and layout
         """
-        # Arrange
-        data_service = timeline_service
-        viz_service = TimelineVisualizationService()
-        timeline_data = data_service.get_sample_timeline_data()
-        
-        # Act
-        chart = viz_service.create_timeline_chart(timeline_data)
-        
         # Assert
-        assert isinstance(chart, go.Figure)
-        assert chart.layout.title.text == "Course of Illness with Diagnoses, Medications, and Inpatient Stays"
-        assert chart.layout.xaxis.title.text == "Date"
-        assert chart.layout.width == 1000
-        assert chart.layout.height == 520
+        layout = chart_spec["layout"]
+        assert isinstance(sample_chart, go.Figure)
+        assert layout["title"]["text"] == "Course of Illness with Diagnoses, Medications, and Inpatient Stays"
+        assert layout["xaxis"]["title"]["text"] == "Date"
+        assert layout["width"] == 1000
+        assert layout["height"] == 520
     
-    def test_chart_contains_inpatient_stay_shapes(self, timeline_service):
+    def test_chart_contains_inpatient_stay_shapes(self, chart_spec, sample_timeline):
         """
         Test: Chart includes rectangle shapes for inpatient stays
         
@@ -186,26 +174,17 @@ class TestTimelineVisualizationService:
         Then: Chart contains rectangle shapes for each stay
         And: Each shape spans from admission to discharge
         """
-        # Arrange
-        data_service = timeline_service
-        viz_service = TimelineVisualizationService()
-        timeline_data = data_service.get_sample_timeline_data()
-        
-        # Act
-        chart = viz_service.create_timeline_chart(timeline_data)
-        
         # Assert
-        shapes = chart.layout.shapes
-        stay_shapes = [s for s in shapes if s.type == "rect"]
-        assert len(stay_shapes) == len(timeline_data.inpatient_stays)
+        stay_shapes = [s for s in chart_spec["layout"]["shapes"] if s["type"] == "rect"]
+        assert len(stay_shapes) == len(sample_timeline.inpatient_stays)
         
         # Verify shape properties
-        for shape in stay_shapes:
-            assert shape.fillcolor == "LightSkyBlue"
-            assert shape.y0 == 0.9
-            assert shape.y1 == 1.1
+        assert all(
+            s["fillcolor"] == "LightSkyBlue" and s["y0"] == 0.9 and s["y1"] == 1.1
+            for s in stay_shapes
+        )
     
-    def test_chart_contains_illness_trajectory_trace(self, timeline_service):
+    def test_chart_contains_illness_trajectory_trace(self, chart_spec):
         """
         Test: Chart includes illness trajectory line
         
@@ -214,25 +193,17 @@ class TestTimelineVisualizationService:
         Then: Chart contains line trace for illness trajectory
         And: Line spans from illness start to end
         """
-        # Arrange
-        data_service = timeline_service
-        viz_service = TimelineVisualizationService()
-        timeline_data = data_service.get_sample_timeline_data()
-        
-        # Act
-        chart = viz_service.create_timeline_chart(timeline_data)
-        
         # Assert
-        traces = chart.data
-        line_traces = [t for t in traces if t.mode == "lines"]
+        traces = chart_spec["data"]
+        line_traces = [t for t in traces if t.get("mode") == "lines"]
         assert len(line_traces) >= 1
         
         # Find illness trajectory trace
-        illness_trace = next(t for t in line_traces if t.name == "Course of Illness")
-        assert illness_trace.line.color == "black"
-        assert illness_trace.line.width == 2
+        illness_trace = next(t for t in line_traces if t.get("name") == "Course of Illness")
+        assert illness_trace["line"]["color"] == "black"
+        assert illness_trace["line"]["width"] == 2
     
-    def test_chart_contains_annotations_for_all_events(self, timeline_service):
+    def test_chart_contains_annotations_for_all_events(self, chart_spec, sample_timeline):
         """
         Test: Chart includes annotations for diagnoses and medications
         
@@ -241,27 +212,19 @@ class TestTimelineVisualizationService:
         Then: Chart contains annotations for all events
         And: Annotations have correct colors and positioning
         """
-        # Arrange
-        data_service = timeline_service
-        viz_service = TimelineVisualizationService()
-        timeline_data = data_service.get_sample_timeline_data()
-        
-        # Act
-        chart = viz_service.create_timeline_chart(timeline_data)
-        
         # Assert
-        annotations = chart.layout.annotations
-        
-        # Count different types of annotations
-        diagnosis_annotations = [a for a in annotations if a.get('arrowcolor') == 'darkred']
-        medication_annotations = [a for a in annotations if a.get('arrowcolor') == 'darkgreen']
-        legend_annotations = [a for a in annotations if 'Legend' in a.get('text', '')]
-        
-        assert len(diagnosis_annotations) == len(timeline_data.diagnoses)
-        assert len(medication_annotations) == len(timeline_data.medications)
-        assert len(legend_annotations) == 2  # Medication and diagnosis legends
+        # Count annotations by arrow color and count legends in one pass
+        colors = Counter()
+        legends = 0
+        for annotation in chart_spec["layout"]["annotations"]:
+            colors[annotation.get('arrowcolor')] += 1
+            legends += 'Legend' in annotation.get('text', '')
+        
+        assert colors['darkred'] == len(sample_timeline.diagnoses)
+        assert colors['darkgreen'] == len(sample_timeline.medications)
+        assert legends == 2  # Medication and diagnosis legends
     
-    def test_chart_layout_configuration(self, timeline_service):
+    def test_chart_layout_configuration(self, chart_spec):
         """
         Test: Chart layout is configured correctly for clinical timeline
         
@@ -271,64 +234,38 @@ class TestTimelineVisualizationService:
         And: Range selectors are present
         And: Y-axis is hidden as expected
         """
-        # Arrange
-        data_service = timeline_service
-        viz_service = TimelineVisualizationService()
-        timeline_data = data_service.get_sample_timeline_data()
-        
-        # Act
-        chart = viz_service.create_timeline_chart(timeline_data)
-        
         # Assert
-        layout = chart.layout
+        layout = chart_spec["layout"]
+        xaxis, yaxis = layout["xaxis"], layout["yaxis"]
         
         # X-axis configuration
-        assert layout.xaxis.type == "date"
-        assert layout.xaxis.tickformat == "%Y-%m-%d"
-        assert layout.xaxis.showgrid == True
-        assert layout.xaxis.rangeslider.visible == True
-        assert len(layout.xaxis.rangeselector.buttons) == 4
+        assert xaxis["type"] == "date"
+        assert xaxis["tickformat"] == "%Y-%m-%d"
+        assert xaxis["showgrid"] == True
+        assert xaxis["rangeslider"]["visible"] == True
+        assert len(xaxis["rangeselector"]["buttons"]) == 4
         
         # Y-axis configuration
-        assert layout.yaxis.visible == False
-        assert layout.yaxis.range == [0.7, 1.35]
+        assert yaxis["visible"] == False
+        assert yaxis["range"] == [0.7, 1.35]
         
         # Other layout properties
-        assert layout.margin.b == 360  # Bottom margin for legends
-        assert layout.showlegend == False
+        assert layout["margin"]["b"] == 360  # Bottom margin for legends
+        assert layout["showlegend"] == False
     
-    def test_chart_range_selectors_configuration(self, timeline_service):
+    @pytest.mark.parametrize("label,count,step", _RANGE_BUTTONS, ids=["6m", "1y", "5y", "all"])
+    def test_range_selector_button(self, range_buttons_by_label, label, count, step):
         """
         Test: Chart has correctly configured range selector buttons
         
         Given: Generated timeline chart
-        When: Examining range selector buttons
-        Then: Contains 6m, 1y, 5y, and all buttons
-        And: Buttons have correct step configurations
+        When: Looking up a range selector button by label
+        Then: The button exists
+        And: It has the expected count and step
         """
-        # Arrange
-        data_service = timeline_service
-        viz_service = TimelineVisualizationService()
-        timeline_data = data_service.get_sample_timeline_data()
-        
         # Act
-        chart = viz_service.create_timeline_chart(timeline_data)
+        button = range_buttons_by_label[label]
         
         # Assert
-        buttons = chart.layout.xaxis.rangeselector.buttons
-        
-        # Check button configurations
-        six_month_button = next(b for b in buttons if b.label == "6m")
-        assert six_month_button.count == 6
-        assert six_month_button.step == "month"
-        
-        one_year_button = next(b for b in buttons if b.label == "1y")
-        assert one_year_button.count == 1
-        assert one_year_button.step == "year"
-        
-        five_year_button = next(b for b in buttons if b.label == "5y")
-        assert five_year_button.count == 5
-        assert five_year_button.step == "year"
-        
-        all_button = next(b for b in buttons if b.step == "all")
-        assert all_button is not None
\ No newline at end of file
+        assert button.get("count") == count
+        assert button["step"] == step